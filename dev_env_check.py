@@ -4,16 +4,88 @@ Local Development Environment Checker
 Checks various files, tools, and configurations on the local dev machine.
 """
 
+import asyncio
+import configparser
+import functools
 import os
-import subprocess
+import re
+import shutil
 import sys
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from datetime import date
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-import json
+from typing import Dict, List, NamedTuple, Tuple, Optional, Union
 import argparse
 
-# Color codes for terminal output
+# JSON parser, imported by _json_loads on first use
+_json_loads_impl = None
+
+def _json_loads(data: bytes):
+    """Parse JSON, importing a parser on first use (orjson when installed).
+
+    Both parsers raise a ValueError subclass on malformed input.
+    """
+    global _json_loads_impl
+    if _json_loads_impl is None:
+        try:
+            from orjson import loads
+        except ImportError:
+            from json import loads
+        _json_loads_impl = loads
+    return _json_loads_impl(data)
+
+# Line tokenizers: one match classifies a line as blank/comment or
+# splits it into its fields
+_SSH_LINE_RE = re.compile(r'^\s*(?:#.*|(?P<key>\S+)\s+(?P<val>\S.*?)\s*)?$')
+# A known_hosts entry: a line whose first non-blank character isn't '#'
+_KNOWN_HOSTS_ENTRY_RE = re.compile(rb'^[^\S\n]*[^\s#]', re.MULTILINE)
+# ...and its host and key type fields, for entries that also carry a key
+_KNOWN_HOSTS_LINE_RE = re.compile(
+    rb'^[^\S\n]*(?P<hosts>[^\s#]\S*)[^\S\n]+(?P<type>\S+)[^\S\n]+\S', re.MULTILINE)
+# An /etc/hosts mapping; [^\S\n] keeps each match within one line
+_HOSTS_LINE_RE = re.compile(
+    rb'^[^\S\n]*(?P<ip>[^\s#]\S*)[^\S\n]+(?P<names>[^#\n]*[^#\s])', re.MULTILINE)
+
+@functools.lru_cache(maxsize=None)
+def _listdir_set(directory: str) -> frozenset:
+    """Return the entry names of a PATH directory, listed once per run"""
+    try:
+        return frozenset(os.listdir(directory))
+    except OSError:
+        return frozenset()
+
+def _which(command: str) -> Optional[str]:
+    """Like shutil.which, but checks cached directory listings before stat-ing"""
+    if os.path.dirname(command):
+        return shutil.which(command)
+    for directory in os.environ.get('PATH', os.defpath).split(os.pathsep):
+        if command in _listdir_set(directory):
+            path = os.path.join(directory, command)
+            if os.access(path, os.X_OK) and not os.path.isdir(path):
+                return path
+    return None
+
+# Per-task result buffer, set while checks run concurrently so that each
+# check's rows stay together and in a deterministic order
+_result_sink: ContextVar[Optional[list]] = ContextVar('_result_sink', default=None)
+
+# Colors and column truncation are only applied when writing to a terminal
+_IS_TTY = sys.stdout.isatty()
+
+# Row templates for the report tables, bound once; positional str.format
+# with a prebuilt template is cheaper per row than the equivalent f-string.
+# The status column is 20 wide with color codes, which take 9 of it.
+_RESULT_ROW = ("{:<15} {:<35} {:<20} {:<50}" if _IS_TTY else "{:<15} {:<35} {:<11} {:<50}").format
+_SSH_CONFIG_ROW = "{:<20} {:<25} {:<15} {:<8} {:<30}".format
+_KNOWN_HOSTS_ROW = "{:<40} {:<25}".format
+_HOSTS_ROW = "{:<20} {:<50}".format
+_SSH_KEYS_ROW = "{:<20} {:<25} {:<15} {:<20} {:<15} {:<10}".format
+
+# Color codes for terminal output (a pure namespace, never instantiated)
 class Colors:
+    __slots__ = ()
     GREEN = '\033[92m'
     RED = '\033[91m'
     YELLOW = '\033[93m'
@@ -21,99 +93,281 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Plain text when piped or redirected, e.g. into a log file
+if not _IS_TTY:
+    Colors.GREEN = Colors.RED = Colors.YELLOW = Colors.BLUE = Colors.BOLD = Colors.END = ''
+
+class Result(NamedTuple):
+    """A single check result row"""
+    category: str
+    item: str
+    status: str
+    details: str = ""
+
 class DevEnvChecker:
+    # Colored status indicators, built once rather than per printed row
+    _STATUS_STR = {
+        "OK": f"{Colors.GREEN}✅ OK{Colors.END}",
+        "MISSING": f"{Colors.RED}❌ MISSING{Colors.END}",
+        "ERROR": f"{Colors.RED}❌ ERROR{Colors.END}",
+        "WARNING": f"{Colors.YELLOW}⚠️  WARNING{Colors.END}",
+    }
+    
+    # Hostnames that are typically mapped to each IP in /etc/hosts
+    _STANDARD_HOSTS = {
+        '127.0.0.1': frozenset({'localhost'}),
+        '::1': frozenset({'localhost'}),
+        '255.255.255.255': frozenset({'broadcasthost'}),
+        'fe80::1%lo0': frozenset({'localhost'}),
+    }
+    
+    # Files inspected by the checks, keyed by name; expanded once into self.paths
+    _PATHS = {
+        'aws_creds': '~/.aws/credentials',
+        'aws_config': '~/.aws/config',
+        'gcp_creds': '~/.config/gcloud/application_default_credentials.json',
+        'gcp_user_creds': '~/.config/gcloud/credentials.db',
+        'netlify_config': '~/.config/netlify/config.json',
+        'doctl_config': '~/.config/doctl/config.yaml',
+        'ansible_user_config': '~/.ansible.cfg',
+        'ansible_global_config': '/etc/ansible/ansible.cfg',
+        'ssh_dir': '~/.ssh',
+        'ssh_config': '~/.ssh/config',
+        'ssh_known_hosts': '~/.ssh/known_hosts',
+        'etc_hosts': '/etc/hosts',
+    }
+    
+    # Public key algorithm -> (key type, detail) for the SSH keys detail table
+    _SSH_KEY_TYPES = {
+        'ssh-rsa': ("RSA", "RSA key"),
+        'ssh-dss': ("DSA", "DSA key"),
+        'ecdsa-sha2-nistp256': ("ECDSA", "ECDSA 256-bit"),
+        'ecdsa-sha2-nistp384': ("ECDSA", "ECDSA 384-bit"),
+        'ecdsa-sha2-nistp521': ("ECDSA", "ECDSA 521-bit"),
+        'ssh-ed25519': ("ED25519", "ED25519 256-bit"),
+    }
+    
+    # At most _SSH_G_CONCURRENCY `ssh -G` lookups run at once, so large
+    # configs can't exhaust file descriptors needed by the other probes
+    _SSH_G_CONCURRENCY = 8
+    
+    # Project-local doctl config locations, relative to the project path
+    _DOCTL_PROJECT_CONFIGS = ('doctl.yaml', '.doctl/config.yaml', 'config/doctl.yaml')
+    
     def __init__(self, project_path: Optional[str] = None):
         self.project_path = project_path
-        self.results = []
+        self.results: List[Result] = []
+        self._status_counts = Counter()
+        self._by_category: Dict[str, List[Result]] = {}
+        self._cmd_cache: Dict[str, Optional[str]] = {}
+        # First line of each tool's version output, keyed by command
+        self._versions: Dict[str, str] = {}
+        # Parsed SSH files, shared by the summary checks and the detail tables
+        self._ssh_config_parsed = None
+        self._known_hosts_parsed = None
+        # Effective per-host settings as resolved by `ssh -G`
+        self._ssh_g_cache: Dict[str, Dict[str, str]] = {}
+        # Bounds concurrent `ssh -G` processes; created inside the running loop
+        self._ssh_g_limit: Optional[asyncio.Semaphore] = None
+        # stat() results (None for missing paths) and file contents (or the
+        # error opening them), so each file is stat-ed and read at most once
+        # per run
+        self._stat_cache: Dict[str, Optional[os.stat_result]] = {}
+        self._read_cache: Dict[str, Union[bytes, OSError]] = {}
+        # Resolve the home directory once instead of on every path lookup
+        self.home = str(Path.home())
+        self.paths: Dict[str, str] = {name: self._expand(path) for name, path in self._PATHS.items()}
         if self.project_path:
-            self.project_path = os.path.expanduser(self.project_path)
+            self.project_path = self._expand(self.project_path)
         self.custom_hosts_entries = []
         
     def add_result(self, category: str, item: str, status: str, details: str = ""):
         """Add a check result to the results list"""
-        self.results.append({
-            'category': category,
-            'item': item,
-            'status': status,
-            'details': details
-        })
+        result = Result(category, item, status, details)
+        sink = _result_sink.get()
+        if sink is not None:
+            sink.append(result)
+        else:
+            self._store(result)
+    
+    def _store(self, result: Result):
+        """Record a result, keeping the summary counters and category groups up to date"""
+        self.results.append(result)
+        self._status_counts[result.status] += 1
+        self._by_category.setdefault(result.category, []).append(result)
+    
+    async def run_command(self, args: List[str], timeout: int = 10, cwd: Optional[str] = None,
+                          capture_stdout: bool = True) -> Tuple[int, str, str]:
+        """Run a command without blocking the event loop, returning (returncode, stdout, stderr)
+
+        With capture_stdout=False, stdout goes to /dev/null and is returned as "".
+        """
+        stdout_target = asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL
+        # With an absolute executable and close_fds=False (our own fds are
+        # non-inheritable anyway), subprocess starts the child with
+        # posix_spawn instead of fork+exec; passing cwd falls back to fork
+        if not os.path.dirname(args[0]):
+            args = [self._resolve(args[0]) or args[0], *args[1:]]
+        proc = await asyncio.create_subprocess_exec(
+            *args, stdout=stdout_target, stderr=asyncio.subprocess.PIPE, cwd=cwd, close_fds=False)
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        return proc.returncode, (stdout or b'').decode(errors='replace'), stderr.decode(errors='replace')
+    
+    async def _collect(self, check) -> list:
+        """Run a check coroutine, capturing its results in a private buffer
+        
+        The buffer lives in a context variable, so it also follows the check
+        into worker threads started with asyncio.to_thread.
+        """
+        buffer = []
+        _result_sink.set(buffer)
+        await check
+        return buffer
+    
+    async def gather_checks(self, *checks):
+        """Run independent check coroutines concurrently, keeping results in submission order"""
+        buffers = await asyncio.gather(*(self._collect(check) for check in checks), return_exceptions=True)
+        for buffer in buffers:
+            if isinstance(buffer, BaseException):
+                raise buffer
+            for result in buffer:
+                self._store(result)
+    
+    def _expand(self, path: str) -> str:
+        """Expand a leading ~ using the cached home directory"""
+        if path == '~' or path.startswith('~/'):
+            return self.home + path[1:]
+        return os.path.expanduser(path)
+    
+    def _stat(self, path: str) -> Optional[os.stat_result]:
+        """Return os.stat(path), or None if it cannot be stat-ed, cached per run"""
+        try:
+            return self._stat_cache[path]
+        except KeyError:
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            self._stat_cache[path] = st
+            return st
+    
+    def _exists(self, path: str) -> bool:
+        """Cached equivalent of os.path.exists"""
+        return self._stat(path) is not None
+    
+    def _read_bytes(self, path: str) -> bytes:
+        """Return the raw contents of a file, read at most once per run
+
+        A failed open is cached too and re-raised on later calls.
+        """
+        cached = self._read_cache.get(path)
+        if cached is None:
+            try:
+                with open(path, 'rb') as f:
+                    cached = f.read()
+            except OSError as e:
+                cached = e
+            self._read_cache[path] = cached
+        if isinstance(cached, OSError):
+            raise cached
+        return cached
+    
+    def _read_head(self, path: str, size: int) -> bytes:
+        """Return the first size bytes of a file, from the read cache when it holds the file"""
+        cached = self._read_cache.get(path)
+        if isinstance(cached, bytes):
+            return cached[:size]
+        with open(path, 'rb') as f:
+            return f.read(size)
+    
+    def _read_text(self, path: str) -> str:
+        """Return the decoded contents of a file, see _read_bytes"""
+        return self._read_bytes(path).decode(errors='replace')
     
     def print_status(self, status: str) -> str:
         """Return colored status indicator"""
-        if status == "OK":
-            return f"{Colors.GREEN}✅ OK{Colors.END}"
-        elif status == "MISSING":
-            return f"{Colors.RED}❌ MISSING{Colors.END}"
-        elif status == "ERROR":
-            return f"{Colors.RED}❌ ERROR{Colors.END}"
-        elif status == "WARNING":
-            return f"{Colors.YELLOW}⚠️  WARNING{Colors.END}"
-        else:
-            return f"{Colors.BLUE}ℹ️  {status}{Colors.END}"
+        return self._STATUS_STR.get(status) or f"{Colors.BLUE}ℹ️  {status}{Colors.END}"
     
-    def check_file_exists(self, filepath: str, category: str, description: str):
-        """Check if a file exists"""
-        expanded_path = os.path.expanduser(filepath)
-        if os.path.exists(expanded_path):
-            # Get file size for additional info
-            size = os.path.getsize(expanded_path)
-            self.add_result(category, description, "OK", f"Size: {size} bytes")
-        else:
+    def check_file_exists(self, filepath: str, category: str, description: str, include_size: bool = False):
+        """Check if a file exists, optionally reporting its size"""
+        expanded_path = self._expand(filepath)
+        # One (cached) stat answers both existence and size
+        st = self._stat(expanded_path)
+        if st is None:
             self.add_result(category, description, "MISSING", f"Path: {expanded_path}")
+            return
+        details = f"Size: {st.st_size} bytes" if include_size else f"Path: {expanded_path}"
+        self.add_result(category, description, "OK", details)
+    
+    def _resolve(self, command: str) -> Optional[str]:
+        """Return the full path of a command, looked up once per run"""
+        try:
+            return self._cmd_cache[command]
+        except KeyError:
+            path = self._cmd_cache[command] = _which(command)
+            return path
     
     def check_command_exists(self, command: str, category: str, description: str):
         """Check if a command exists and is executable"""
-        try:
-            result = subprocess.run(['which', command], capture_output=True, text=True)
-            if result.returncode == 0:
-                path = result.stdout.strip()
-                self.add_result(category, description, "OK", f"Path: {path}")
-                return True
-            else:
-                self.add_result(category, description, "MISSING", "Command not found")
-                return False
-        except Exception as e:
-            self.add_result(category, description, "ERROR", str(e))
-            return False
+        path = self._resolve(command)
+        if path:
+            self.add_result(category, description, "OK", f"Path: {path}")
+            return True
+        self.add_result(category, description, "MISSING", "Command not found")
+        return False
     
-    def check_command_version(self, command: str, category: str, description: str, version_flag: str = "--version"):
+    async def check_command_version(self, command: str, category: str, description: str, version_flag: str = "--version"):
         """Check command version"""
-        if not self.check_command_exists(command, category, f"{description} (installed)"):
+        # The (memoized) PATH lookup settles a missing tool without a spawn;
+        # the resolved path also spares exec its own PATH search
+        path = self._resolve(command)
+        if path is None:
+            self.add_result(category, f"{description} (installed)", "MISSING", "Command not found")
             return
-        
         try:
-            result = subprocess.run([command, version_flag], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                version = result.stdout.strip().split('\n')[0]  # First line usually contains version
-                self.add_result(category, f"{description} (version)", "OK", version)
-            else:
-                self.add_result(category, f"{description} (version)", "ERROR", result.stderr.strip())
-        except subprocess.TimeoutExpired:
+            returncode, stdout, stderr = await self.run_command([path, version_flag], timeout=10)
+        except FileNotFoundError:
+            self.add_result(category, f"{description} (installed)", "MISSING", "Command not found")
+            return
+        except asyncio.TimeoutError:
+            self.check_command_exists(command, category, f"{description} (installed)")
             self.add_result(category, f"{description} (version)", "ERROR", "Command timeout")
+            return
         except Exception as e:
-            self.add_result(category, f"{description} (version)", "ERROR", str(e))
+            self.add_result(category, f"{description} (installed)", "ERROR", str(e))
+            return
+        
+        self.check_command_exists(command, category, f"{description} (installed)")
+        if returncode == 0:
+            version = stdout.strip().partition('\n')[0]  # First line usually contains version
+            self._versions[command] = version
+            self.add_result(category, f"{description} (version)", "OK", version)
+        else:
+            self.add_result(category, f"{description} (version)", "ERROR", stderr.strip())
+    
+    def _read_ini(self, path: str) -> configparser.ConfigParser:
+        """Parse an INI-style file such as the AWS credentials or config"""
+        # No interpolation: secrets may contain '%'; AWS tolerates repeats
+        parser = configparser.ConfigParser(interpolation=None, strict=False)
+        parser.read_string(self._read_text(path), source=path)
+        return parser
     
     def check_aws_credentials_file(self):
         """Analyze AWS credentials file for profiles"""
-        aws_creds_path = os.path.expanduser("~/.aws/credentials")
+        aws_creds_path = self.paths['aws_creds']
         
-        if not os.path.exists(aws_creds_path):
+        if not self._exists(aws_creds_path):
             self.add_result("AWS", "Credentials file", "MISSING", f"Path: {aws_creds_path}")
             return
         
         try:
-            with open(aws_creds_path, 'r') as f:
-                content = f.read()
-            
             # Parse profiles from credentials file
-            profiles = []
-            lines = content.split('\n')
-            
-            for line in lines:
-                line = line.strip()
-                if line.startswith('[') and line.endswith(']'):
-                    profile_name = line[1:-1]  # Remove brackets
-                    profiles.append(profile_name)
+            profiles = self._read_ini(aws_creds_path).sections()
             
             # Create summary
             if profiles:
@@ -136,46 +390,29 @@ class DevEnvChecker:
     
     def check_aws_config_file(self):
         """Analyze AWS config file for regions and settings"""
-        aws_config_path = os.path.expanduser("~/.aws/config")
+        aws_config_path = self.paths['aws_config']
         
-        if not os.path.exists(aws_config_path):
+        if not self._exists(aws_config_path):
             self.add_result("AWS", "Config file", "MISSING", f"Path: {aws_config_path}")
             return
         
         try:
-            with open(aws_config_path, 'r') as f:
-                content = f.read()
-            
             # Parse config settings
-            lines = content.split('\n')
+            config = self._read_ini(aws_config_path)
             default_region = None
-            default_output = None
             regions = set()
             profiles = []
             
-            current_profile = None
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                if line.startswith('[') and line.endswith(']'):
-                    profile_name = line[1:-1]  # Remove brackets
-                    if profile_name.startswith('profile '):
-                        profile_name = profile_name[8:]  # Remove 'profile ' prefix
-                    current_profile = profile_name
-                    profiles.append(profile_name)
-                elif '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    if key == 'region':
-                        regions.add(value)
-                        if current_profile == 'default' or default_region is None:
-                            default_region = value
-                    elif key == 'output' and current_profile == 'default':
-                        default_output = value
+            for section in config.sections():
+                profile_name = section[8:] if section.startswith('profile ') else section
+                profiles.append(profile_name)
+                region = config.get(section, 'region', fallback=None)
+                if region is not None:
+                    regions.add(region)
+                    if profile_name == 'default' or default_region is None:
+                        default_region = region
+            
+            default_output = config.get('default', 'output', fallback=None)
             
             # Create summary
             summary_parts = []
@@ -203,41 +440,49 @@ class DevEnvChecker:
         except Exception as e:
             self.add_result("AWS", "Config file", "ERROR", f"Failed to parse: {str(e)}")
     
-    def check_aws_credentials(self):
+    async def check_aws_credentials(self):
         """Check AWS credentials and connectivity with intelligent analysis"""
-        # Analyze credentials file
-        self.check_aws_credentials_file()
+        if self._resolve("aws") is None:
+            self.add_result("AWS", "AWS CLI", "MISSING", "Command not found")
+            return
         
-        # Analyze config file
-        self.check_aws_config_file()
+        # Analyze credentials and config files off the event loop
+        await asyncio.to_thread(self.check_aws_credentials_file)
+        await asyncio.to_thread(self.check_aws_config_file)
         
-        # Test AWS CLI connectivity
-        if self.check_command_exists("aws", "AWS", "AWS CLI"):
-            try:
-                result = subprocess.run(['aws', 'sts', 'get-caller-identity'], 
-                                      capture_output=True, text=True, timeout=15)
-                if result.returncode == 0:
-                    identity = json.loads(result.stdout)
-                    user_info = identity.get('Arn', 'Unknown user')
-                    self.add_result("AWS", "API connectivity", "OK", user_info)
-                else:
-                    self.add_result("AWS", "API connectivity", "ERROR", result.stderr.strip())
-            except subprocess.TimeoutExpired:
-                self.add_result("AWS", "API connectivity", "ERROR", "Request timeout")
-            except Exception as e:
-                self.add_result("AWS", "API connectivity", "ERROR", str(e))
+        self.check_command_exists("aws", "AWS", "AWS CLI")
+        
+        # Test AWS CLI connectivity; without any credentials the call can
+        # only fail or hang on a login prompt, so don't make it
+        if not (self._exists(self.paths['aws_creds'])
+                or self._exists(self.paths['aws_config'])
+                or 'AWS_ACCESS_KEY_ID' in os.environ):
+            self.add_result("AWS", "API connectivity", "INFO", "Skipped (no credentials file)")
+            return
+        try:
+            # Let the CLI extract the ARN instead of parsing its JSON
+            returncode, stdout, stderr = await self.run_command(
+                ['aws', 'sts', 'get-caller-identity', '--query', 'Arn', '--output', 'text'], timeout=15)
+            if returncode == 0:
+                user_info = stdout.strip() or 'Unknown user'
+                self.add_result("AWS", "API connectivity", "OK", user_info)
+            else:
+                self.add_result("AWS", "API connectivity", "ERROR", stderr.strip())
+        except asyncio.TimeoutError:
+            self.add_result("AWS", "API connectivity", "ERROR", "Request timeout")
+        except Exception as e:
+            self.add_result("AWS", "API connectivity", "ERROR", str(e))
     
     def check_gcp_credentials_file(self):
         """Analyze GCP application credentials file"""
-        gcp_creds_path = os.path.expanduser("~/.config/gcloud/application_default_credentials.json")
+        gcp_creds_path = self.paths['gcp_creds']
         
-        if not os.path.exists(gcp_creds_path):
+        if not self._exists(gcp_creds_path):
             self.add_result("GCP", "Application credentials", "MISSING", f"Path: {gcp_creds_path}")
             return
         
         try:
-            with open(gcp_creds_path, 'r') as f:
-                creds_data = json.load(f)
+            creds_data = _json_loads(self._read_bytes(gcp_creds_path))
             
             # Extract useful information
             summary_parts = []
@@ -273,21 +518,20 @@ class DevEnvChecker:
             else:
                 self.add_result("GCP", "Application credentials", "OK", "Valid credentials")
             
-        except json.JSONDecodeError:
+        except ValueError:
             self.add_result("GCP", "Application credentials", "ERROR", "Invalid JSON format")
         except PermissionError:
             self.add_result("GCP", "Application credentials", "ERROR", "Permission denied")
         except Exception as e:
             self.add_result("GCP", "Application credentials", "ERROR", f"Failed to parse: {str(e)}")
     
-    def check_netlify_cli(self):
+    async def check_netlify_cli(self):
         """Check Netlify CLI status and configuration"""
         # Check for global config file
-        netlify_config_path = os.path.expanduser("~/.config/netlify/config.json")
-        if os.path.exists(netlify_config_path):
+        netlify_config_path = self.paths['netlify_config']
+        if self._exists(netlify_config_path):
             try:
-                with open(netlify_config_path, 'r') as f:
-                    config = json.load(f)
+                config = _json_loads(self._read_bytes(netlify_config_path))
                 user_id = config.get('userId')
                 details = f"User ID: {user_id}" if user_id else "Logged out"
                 self.add_result("Netlify", "Global config", "OK", details)
@@ -308,11 +552,11 @@ class DevEnvChecker:
                         self.add_result("Netlify", "Project context", "ERROR", f"Directory not found: {self.project_path}")
                         return
 
-                result = subprocess.run(['netlify', 'status'], capture_output=True, text=True, timeout=15, cwd=cwd)
-                if result.returncode == 0:
+                returncode, stdout, _ = await self.run_command(['netlify', 'status'], timeout=15, cwd=cwd)
+                if returncode == 0:
                     # Extract user email from status
                     user_email = "Unknown"
-                    for line in result.stdout.split('\n'):
+                    for line in stdout.splitlines():
                         # Handle different output formats from 'netlify status'
                         if 'Netlify User:' in line:
                             user_email = line.split('Netlify User:')[1].strip()
@@ -323,54 +567,68 @@ class DevEnvChecker:
                     self.add_result("Netlify", "Authentication", "OK", f"Logged in as: {user_email}")
                 else:
                     self.add_result("Netlify", "Authentication", "WARNING", "Not logged in")
-            except subprocess.TimeoutExpired:
+            except asyncio.TimeoutError:
                 self.add_result("Netlify", "Authentication", "ERROR", "Request timeout")
             except Exception as e:
                 self.add_result("Netlify", "Authentication", "ERROR", str(e))
 
-    def check_gcp_credentials(self):
+    async def check_gcp_credentials(self):
         """Check Google Cloud credentials and connectivity with intelligent analysis"""
-        # Analyze application credentials
-        self.check_gcp_credentials_file()
+        if self._resolve("gcloud") is None:
+            self.add_result("GCP", "gcloud CLI", "MISSING", "Command not found")
+            return
         
-        # Test gcloud connectivity
-        if self.check_command_exists("gcloud", "GCP", "gcloud CLI"):
-            try:
-                result = subprocess.run(['gcloud', 'auth', 'list', '--format=json'], 
-                                      capture_output=True, text=True, timeout=15)
-                if result.returncode == 0:
-                    accounts = json.loads(result.stdout)
-                    active_accounts = [acc for acc in accounts if acc.get('status') == 'ACTIVE']
-                    if active_accounts:
-                        account = active_accounts[0]['account']
-                        self.add_result("GCP", "Authentication", "OK", f"Active: {account}")
-                    else:
-                        self.add_result("GCP", "Authentication", "WARNING", "No active accounts")
+        # Analyze application credentials off the event loop
+        await asyncio.to_thread(self.check_gcp_credentials_file)
+        
+        self.check_command_exists("gcloud", "GCP", "gcloud CLI")
+        
+        # Test gcloud connectivity, unless neither application default nor
+        # user (gcloud auth login) credentials have been stored
+        if not (self._exists(self.paths['gcp_creds']) or self._exists(self.paths['gcp_user_creds'])):
+            self.add_result("GCP", "Authentication", "INFO", "Skipped (no credentials file)")
+            return
+        try:
+            # Let the CLI filter for the active account and print it as plain text
+            returncode, stdout, stderr = await self.run_command(
+                ['gcloud', 'auth', 'list', '--filter=status:ACTIVE', '--format=value(account)'], timeout=15)
+            if returncode == 0:
+                active_accounts = stdout.split()
+                if active_accounts:
+                    account = active_accounts[0]
+                    self.add_result("GCP", "Authentication", "OK", f"Active: {account}")
                 else:
-                    self.add_result("GCP", "Authentication", "ERROR", result.stderr.strip())
-            except subprocess.TimeoutExpired:
-                self.add_result("GCP", "Authentication", "ERROR", "Request timeout")
-            except Exception as e:
-                self.add_result("GCP", "Authentication", "ERROR", str(e))
+                    self.add_result("GCP", "Authentication", "WARNING", "No active accounts")
+            else:
+                self.add_result("GCP", "Authentication", "ERROR", stderr.strip())
+        except asyncio.TimeoutError:
+            self.add_result("GCP", "Authentication", "ERROR", "Request timeout")
+        except Exception as e:
+            self.add_result("GCP", "Authentication", "ERROR", str(e))
     
-    def check_digitalocean_credentials(self):
+    async def check_digitalocean_credentials(self):
         """Check DigitalOcean credentials with smart detection"""
-        # Smart detection for doctl config
-        self.check_doctl_config_smart()
+        if self._resolve("doctl") is None:
+            self.add_result("DigitalOcean", "doctl CLI", "MISSING", "Command not found")
+            return
+        
+        # Smart detection for doctl config, off the event loop
+        await asyncio.to_thread(self.check_doctl_config_smart)
+        
+        self.check_command_exists("doctl", "DigitalOcean", "doctl CLI")
         
         # Test doctl connectivity
-        if self.check_command_exists("doctl", "DigitalOcean", "doctl CLI"):
-            try:
-                result = subprocess.run(['doctl', 'account', 'get'], 
-                                      capture_output=True, text=True, timeout=15)
-                if result.returncode == 0:
-                    self.add_result("DigitalOcean", "API connectivity", "OK", "Account accessible")
-                else:
-                    self.add_result("DigitalOcean", "API connectivity", "ERROR", result.stderr.strip())
-            except subprocess.TimeoutExpired:
-                self.add_result("DigitalOcean", "API connectivity", "ERROR", "Request timeout")
-            except Exception as e:
-                self.add_result("DigitalOcean", "API connectivity", "ERROR", str(e))
+        try:
+            returncode, _, stderr = await self.run_command(
+                ['doctl', 'account', 'get'], timeout=15, capture_stdout=False)
+            if returncode == 0:
+                self.add_result("DigitalOcean", "API connectivity", "OK", "Account accessible")
+            else:
+                self.add_result("DigitalOcean", "API connectivity", "ERROR", stderr.strip())
+        except asyncio.TimeoutError:
+            self.add_result("DigitalOcean", "API connectivity", "ERROR", "Request timeout")
+        except Exception as e:
+            self.add_result("DigitalOcean", "API connectivity", "ERROR", str(e))
     
     def check_ansible_config_smart(self):
         """Smart detection for Ansible configuration files"""
@@ -379,153 +637,200 @@ class DevEnvChecker:
         if self.project_path:
             project_config_path = os.path.join(self.project_path, 'ansible.cfg')
 
-        if project_config_path and os.path.exists(project_config_path):
+        if project_config_path and self._exists(project_config_path):
             self.add_result("Ansible", "Config file", "OK", f"Project: {project_config_path}")
-        elif os.path.exists('./ansible.cfg'):
+        elif self._exists('./ansible.cfg'):
             self.add_result("Ansible", "Config file", "OK", "Project: ./ansible.cfg")
         # Check user home directory
-        elif os.path.exists(os.path.expanduser('~/.ansible.cfg')):
+        elif self._exists(self.paths['ansible_user_config']):
             self.add_result("Ansible", "Config file", "OK", "User: ~/.ansible.cfg")
         else:
             self.add_result("Ansible", "Config file", "MISSING", "No project or user config found")
         
         # Check system-wide config (separate check)
-        if os.path.exists('/etc/ansible/ansible.cfg'):
+        if self._exists(self.paths['ansible_global_config']):
             self.add_result("Ansible", "Global config", "OK", "System: /etc/ansible/ansible.cfg")
         else:
             self.add_result("Ansible", "Global config", "MISSING", "Path: /etc/ansible/ansible.cfg")
     
     def check_doctl_config_smart(self):
         """Smart detection for DigitalOcean doctl configuration files"""
-        project_configs = [
-            'doctl.yaml',
-            '.doctl/config.yaml',
-            'config/doctl.yaml'
-        ]
-        
         # Check for project-specific config first
         project_found = False
         search_paths = [self.project_path] if self.project_path else ['.']
 
         for base_path in search_paths:
             if project_found: break
-            for config_file in project_configs:
+            for config_file in self._DOCTL_PROJECT_CONFIGS:
                 config_path = os.path.join(base_path, config_file)
-                if os.path.exists(config_path):
+                if self._exists(config_path):
                     self.add_result("DigitalOcean", "Config file", "OK", f"Project: {config_path}")
                     project_found = True
                     break
         
         # Check global config if no project config found
         if not project_found:
-            global_config = os.path.expanduser('~/.config/doctl/config.yaml')
-            if os.path.exists(global_config):
+            global_config = self.paths['doctl_config']
+            if self._exists(global_config):
                 self.add_result("DigitalOcean", "Config file", "OK", "Global: ~/.config/doctl/config.yaml")
             else:
                 self.add_result("DigitalOcean", "Config file", "MISSING", "No project or global config found")
     
-    def check_ssh_config(self):
-        """Check and parse SSH configuration"""
-        ssh_config_path = os.path.expanduser("~/.ssh/config")
-        
-        if not os.path.exists(ssh_config_path):
-            self.add_result("SSH", "SSH config", "MISSING", f"Path: {ssh_config_path}")
-            return
-        
-        try:
-            with open(ssh_config_path, 'r') as f:
-                content = f.read()
+    def _parse_ssh_config(self) -> Tuple[Dict[str, Dict[str, str]], Dict[str, str]]:
+        """Parse ~/.ssh/config once into (per-host settings, global settings)"""
+        if self._ssh_config_parsed is None:
+            content = self._read_text(self.paths['ssh_config'])
             
-            # Parse SSH config for key settings
-            lines = content.split('\n')
-            hosts = []
+            # Single pass; only the global settings of interest are
+            # collected, and only until all have been seen
+            hosts_config = {}
             global_settings = {}
+            wanted = {'serveraliveinterval', 'compression', 'forwardagent'}
             current_host = None
             
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith('#'):
+            match_line = _SSH_LINE_RE.match
+            for line in content.splitlines():
+                m = match_line(line)
+                # No match is a bare keyword; no key is a blank or comment line
+                if m is None or m.group('key') is None:
                     continue
+                key = m.group('key').lower()
+                value = m.group('val')
                 
-                if line.lower().startswith('host '):
-                    host_name = line.split(None, 1)[1]
-                    if host_name != '*':  # Skip global host patterns for counting
-                        hosts.append(host_name)
-                    current_host = host_name
-                elif current_host is None:  # Global settings
-                    if ' ' in line:
-                        key, value = line.split(None, 1)
-                        global_settings[key.lower()] = value
+                if key == 'host':
+                    current_host = value
+                    hosts_config.setdefault(current_host, {})
+                elif current_host is not None:
+                    hosts_config[current_host][key] = value
+                elif key in wanted:  # Global settings
+                    global_settings[key] = value
+                    wanted.discard(key)
             
-            # Create simple summary - just host count
-            if hosts:
-                summary = f"Hosts: {len(hosts)}"
-            else:
-                summary = "No hosts configured"
+            self._ssh_config_parsed = (hosts_config, global_settings)
+        return self._ssh_config_parsed
+    
+    def _parse_known_hosts(self) -> List[Tuple[List[bytes], bytes]]:
+        """Parse ~/.ssh/known_hosts once into [(hosts, key type)]; only the detail table needs this"""
+        if self._known_hosts_parsed is None:
+            entries = []
             
-            self.add_result("SSH", "SSH config", "OK", summary)
+            # One regex scan over the whole file picks out the host and key
+            # type fields; comments, blank lines and the key blobs are
+            # skipped inside the regex engine
+            data = self._read_bytes(self.paths['ssh_known_hosts'])
+            for m in _KNOWN_HOSTS_LINE_RE.finditer(data):
+                host_part, key_type = m.group('hosts', 'type')
+                
+                # Extract hostname (handle hashed hosts)
+                if host_part.startswith(b'|1|'):
+                    hosts = [b'[hashed]']
+                else:
+                    # Handle comma-separated hosts and ports; most lines
+                    # name a single host, so avoid the split for those
+                    hosts = []
+                    names = host_part.split(b',') if b',' in host_part else (host_part,)
+                    for host in names:
+                        # Remove port numbers and brackets
+                        clean_host = host.partition(b':')[0].strip(b'[]')
+                        if clean_host:
+                            hosts.append(clean_host)
+                
+                entries.append((hosts, key_type))
             
+            self._known_hosts_parsed = entries
+        return self._known_hosts_parsed
+    
+    async def _ssh_resolve_host(self, host: str):
+        """Resolve one host's effective settings with `ssh -G` and cache them"""
+        try:
+            # No -F: ssh then reads ~/.ssh/config and /etc/ssh/ssh_config as it
+            # would for a real connection. '--' keeps a stanza name starting
+            # with '-' from being read as an option
+            async with self._ssh_g_limit:
+                returncode, stdout, _ = await self.run_command(
+                    ['ssh', '-G', '--', host], timeout=5)
+        except Exception:
+            return
+        if returncode != 0:
+            return
+        
+        resolved = {}
+        for line in stdout.splitlines():
+            key, _, value = line.partition(' ')
+            resolved.setdefault(key, value)  # Keep the first of repeated keys
+        self._ssh_g_cache[host] = resolved
+    
+    async def resolve_ssh_hosts(self):
+        """Resolve every concrete Host entry through ssh itself
+        
+        ssh applies Include, Match and first-match-wins rules that the
+        local parser does not, so the detail table prefers its answers.
+        """
+        if self._resolve("ssh") is None:
+            return
+        try:
+            # Parse off the event loop, like the other file checks
+            hosts_config, _ = await asyncio.to_thread(self._parse_ssh_config)
+        except Exception:
+            return
+        
+        # Only the first name of each stanza, and never wildcard patterns
+        names = {host.split()[0] for host in hosts_config if host.strip()}
+        names = [name for name in names if not any(c in name for c in '*?!')]
+        self._ssh_g_limit = asyncio.Semaphore(self._SSH_G_CONCURRENCY)
+        await asyncio.gather(*(self._ssh_resolve_host(name) for name in names))
+    
+    def check_ssh_config(self):
+        """Check and parse SSH configuration"""
+        try:
+            hosts_config, _ = self._parse_ssh_config()
+        except FileNotFoundError:
+            self.add_result("SSH", "SSH config", "MISSING", f"Path: {self.paths['ssh_config']}")
+            return
         except Exception as e:
             self.add_result("SSH", "SSH config", "ERROR", f"Failed to parse: {str(e)}")
+            return
+        
+        # Create simple summary - just host count, skipping global host patterns
+        hosts = [host for host in hosts_config if host != '*']
+        if hosts:
+            summary = f"Hosts: {len(hosts)}"
+        else:
+            summary = "No hosts configured"
+        
+        self.add_result("SSH", "SSH config", "OK", summary)
     
     def check_ssh_known_hosts(self):
         """Check and parse SSH known hosts"""
-        known_hosts_path = os.path.expanduser("~/.ssh/known_hosts")
-        
-        if not os.path.exists(known_hosts_path):
-            self.add_result("SSH", "Known hosts", "MISSING", f"Path: {known_hosts_path}")
-            return
-        
         try:
-            with open(known_hosts_path, 'r') as f:
-                lines = f.readlines()
-            
-            # Parse known hosts
-            hosts = set()
-            key_types = {}
-            
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                parts = line.split()
-                if len(parts) >= 3:
-                    host_part = parts[0]
-                    key_type = parts[1]
-                    
-                    # Extract hostname (handle hashed hosts)
-                    if host_part.startswith('|1|'):
-                        hosts.add('[hashed]')
-                    else:
-                        # Handle comma-separated hosts and ports
-                        for host in host_part.split(','):
-                            # Remove port numbers and brackets
-                            clean_host = host.split(':')[0].strip('[]')
-                            if clean_host:
-                                hosts.add(clean_host)
-                    
-                    # Count key types
-                    key_types[key_type] = key_types.get(key_type, 0) + 1
-            
-            # Create simple summary - just entry count
-            non_empty_lines = [line for line in lines if line.strip() and not line.strip().startswith('#')]
-            summary = f"Entries: {len(non_empty_lines)}"
-            
-            self.add_result("SSH", "Known hosts", "OK", summary)
-            
+            # The summary only reports a count, so count entry lines in one
+            # regex scan instead of tokenizing them
+            data = self._read_bytes(self.paths['ssh_known_hosts'])
+            entry_count = len(_KNOWN_HOSTS_ENTRY_RE.findall(data))
+        except FileNotFoundError:
+            self.add_result("SSH", "Known hosts", "MISSING", f"Path: {self.paths['ssh_known_hosts']}")
+            return
         except Exception as e:
             self.add_result("SSH", "Known hosts", "ERROR", f"Failed to parse: {str(e)}")
+            return
+        
+        # Create simple summary - just entry count
+        summary = f"Entries: {entry_count}"
+        
+        self.add_result("SSH", "Known hosts", "OK", summary)
     
     def check_ssh_keys(self):
         """Check SSH keys in .ssh directory"""
-        ssh_dir = os.path.expanduser("~/.ssh")
+        ssh_dir = self.paths['ssh_dir']
         
-        if not os.path.exists(ssh_dir):
+        # Opening the directory answers existence and readability in one go
+        try:
+            with os.scandir(ssh_dir) as it:
+                root_entries = {e.name: e for e in it if not e.name.startswith('.')}
+        except (FileNotFoundError, NotADirectoryError):
             self.add_result("SSH Keys", "SSH directory", "MISSING", f"Path: {ssh_dir}")
             return
-        
-        if not os.access(ssh_dir, os.R_OK):
+        except PermissionError:
             self.add_result("SSH Keys", "SSH directory", "WARNING", f"Permission denied: {ssh_dir}")
             return
         
@@ -535,48 +840,49 @@ class DevEnvChecker:
             orphaned_keys = []
             weak_keys = []
             
-            def scan_directory(directory, relative_path="", depth=0, max_depth=3):
+            def scan_directory(directory, relative_path="", depth=0, max_depth=3, entries=None):
                 """Recursively scan directory for SSH keys with depth limit"""
                 if depth > max_depth:
                     return
                 
-                try:
-                    items = os.listdir(directory)
-                except PermissionError as e:
-                    warnings.append(f"Permission denied: {relative_path or 'root'}")
-                    return
+                # One scandir pass; the entries carry their file type, and
+                # key pairs are matched by name instead of stat-ing siblings
+                if entries is None:
+                    try:
+                        with os.scandir(directory) as it:
+                            entries = {e.name: e for e in it if not e.name.startswith('.')}
+                    except PermissionError as e:
+                        warnings.append(f"Permission denied: {relative_path or 'root'}")
+                        return
                 
-                for item in items:
-                    if item.startswith('.'):
-                        continue
-                        
-                    item_path = os.path.join(directory, item)
+                for item, entry in entries.items():
+                    item_path = entry.path
                     item_relative = os.path.join(relative_path, item) if relative_path else item
                     
-                    if os.path.isfile(item_path):
+                    if entry.is_file():
                         # Check for public keys without private keys
                         if item.endswith('.pub'):
-                            private_key_path = item_path[:-4]  # Remove .pub extension
-                            if not os.path.exists(private_key_path):
+                            if item[:-4] not in entries:  # Remove .pub extension
                                 orphaned_keys.append(f"Public key without private: {item_relative}")
                         
                         # Check if it's a potential private key (no .pub extension)
                         elif not item.endswith('.pub'):
-                            pub_path = item_path + '.pub'
+                            pub_entry = entries.get(item + '.pub')
                             
-                            if os.path.exists(pub_path):
+                            if pub_entry is not None:
                                 try:
-                                    # Try to determine key type by reading the public key
-                                    with open(pub_path, 'r') as f:
-                                        pub_content = f.read().strip()
+                                    # The key type is the first field of the public key,
+                                    # so a short prefix is enough to classify it
+                                    head = self._read_head(pub_entry.path, 16)
                                     
                                     key_type = "Unknown"
                                     is_weak = False
                                     
-                                    if pub_content.startswith('ssh-rsa '):
+                                    if head.startswith(b'ssh-rsa '):
                                         key_type = "RSA"
-                                        # Check RSA key strength (basic heuristic)
-                                        parts = pub_content.split()
+                                        # Check RSA key strength (basic heuristic); only
+                                        # this needs the whole key
+                                        parts = self._read_text(pub_entry.path).split()
                                         if len(parts) >= 2:
                                             # RSA keys < 2048 bits are considered weak
                                             # This is a rough estimate based on key length
@@ -584,13 +890,13 @@ class DevEnvChecker:
                                             if len(key_data) < 350:  # Rough estimate for < 2048 bit
                                                 is_weak = True
                                                 weak_keys.append(f"{item_relative}: RSA key may be < 2048 bits")
-                                    elif pub_content.startswith('ssh-dss '):
+                                    elif head.startswith(b'ssh-dss '):
                                         key_type = "DSA"
                                         is_weak = True
                                         weak_keys.append(f"{item_relative}: DSA keys are deprecated")
-                                    elif pub_content.startswith('ecdsa-sha2-'):
+                                    elif head.startswith(b'ecdsa-sha2-'):
                                         key_type = "ECDSA"
-                                    elif pub_content.startswith('ssh-ed25519 '):
+                                    elif head.startswith(b'ssh-ed25519 '):
                                         key_type = "ED25519"
                                     
                                     found_keys.append({
@@ -615,12 +921,12 @@ class DevEnvChecker:
                                 except:
                                     pass  # Not a readable key file
                     
-                    elif os.path.isdir(item_path) and depth < max_depth:
+                    elif entry.is_dir() and depth < max_depth:
                         # Recursively scan subdirectory
                         scan_directory(item_path, item_relative, depth + 1, max_depth)
             
-            # Start scanning from the main .ssh directory
-            scan_directory(ssh_dir)
+            # Start scanning from the main .ssh directory, already listed above
+            scan_directory(ssh_dir, entries=root_entries)
             
             # Create summary
             all_issues = []
@@ -666,49 +972,27 @@ class DevEnvChecker:
     
     def check_hosts_file(self):
         """Check /etc/hosts file and identify non-standard entries"""
-        hosts_path = "/etc/hosts"
+        hosts_path = self.paths['etc_hosts']
         
-        if not os.path.exists(hosts_path):
+        if not self._exists(hosts_path):
             self.add_result("System", "/etc/hosts", "MISSING", "File not found")
             return
         
         try:
-            with open(hosts_path, 'r') as f:
-                lines = f.readlines()
-            
-            # Standard entries that are typically found in /etc/hosts
-            standard_entries = {
-                '127.0.0.1': ['localhost'],
-                '::1': ['localhost'],
-                '255.255.255.255': ['broadcasthost'],
-                'fe80::1%lo0': ['localhost']
-            }
-            
+            standard_hosts = self._STANDARD_HOSTS
             custom_entries = []
             total_entries = 0
             
-            for line in lines:
-                line = line.strip()
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Parse the line
-                parts = line.split()
-                if len(parts) < 2:
-                    continue
-                
-                ip = parts[0]
-                hostnames = parts[1:]
+            # One regex scan over the whole file; blank lines, comments and
+            # lines without a hostname are skipped inside the regex engine
+            for m in _HOSTS_LINE_RE.finditer(self._read_bytes(hosts_path)):
+                ip = m.group('ip').decode(errors='replace')
+                hostnames = m.group('names').decode(errors='replace').split()
                 total_entries += 1
                 
-                # Check if this is a standard entry
-                is_standard = False
-                if ip in standard_entries:
-                    # Check if hostnames match standard ones
-                    expected_hostnames = standard_entries[ip]
-                    if set(hostnames).issubset(set(expected_hostnames)):
-                        is_standard = True
+                # Standard only if every hostname is a standard one for this IP
+                expected = standard_hosts.get(ip)
+                is_standard = expected is not None and expected.issuperset(hostnames)
                 
                 # If not standard, add to custom entries
                 if not is_standard:
@@ -744,50 +1028,33 @@ class DevEnvChecker:
     
     def print_ssh_config_details(self):
         """Print detailed SSH configuration table"""
-        ssh_config_path = os.path.expanduser("~/.ssh/config")
-        
-        if not os.path.exists(ssh_config_path):
+        try:
+            hosts_config, _ = self._parse_ssh_config()
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Error parsing SSH config: {e}")
             return
         
         try:
-            with open(ssh_config_path, 'r') as f:
-                content = f.read()
-            
-            # Parse SSH config for detailed host information
-            lines = content.split('\n')
-            hosts_config = {}
-            current_host = None
-            global_settings = {}
-            
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                if line.lower().startswith('host '):
-                    current_host = line.split(None, 1)[1]
-                    if current_host not in hosts_config:
-                        hosts_config[current_host] = {}
-                elif current_host and ' ' in line:
-                    key, value = line.split(None, 1)
-                    hosts_config[current_host][key.lower()] = value
-                elif current_host is None and ' ' in line:  # Global settings
-                    key, value = line.split(None, 1)
-                    global_settings[key.lower()] = value
-            
             if hosts_config:
-                print(f"\n{Colors.BOLD}🔧 SSH Configuration Details{Colors.END}")
-                print("=" * 100)
-                print(f"{Colors.BOLD}{'Host':<20} {'Hostname':<25} {'User':<15} {'Port':<8} {'Other Settings':<30}{Colors.END}")
-                print("-" * 100)
+                out = []
+                out.append(f"\n{Colors.BOLD}🔧 SSH Configuration Details{Colors.END}")
+                out.append("=" * 100)
+                out.append(f"{Colors.BOLD}{'Host':<20} {'Hostname':<25} {'User':<15} {'Port':<8} {'Other Settings':<30}{Colors.END}")
+                out.append("-" * 100)
                 
                 for host, config in hosts_config.items():
                     if host == '*':  # Skip global patterns
                         continue
                     
-                    hostname = config.get('hostname', '')
-                    user = config.get('user', '')
-                    port = config.get('port', '22')
+                    # Prefer the effective values from `ssh -G`, falling
+                    # back to the stanza itself for patterns and failures
+                    resolved = (self._ssh_g_cache.get(host.split()[0], config)
+                                if host.strip() else config)
+                    hostname = resolved.get('hostname', '')
+                    user = resolved.get('user', '')
+                    port = resolved.get('port', '22')
                     
                     # Collect other interesting settings
                     other_settings = []
@@ -802,65 +1069,50 @@ class DevEnvChecker:
                     if len(other_settings) > 2:
                         other_str += '...'
                     
-                    print(f"{host:<20} {hostname:<25} {user:<15} {port:<8} {other_str:<30}")
+                    out.append(_SSH_CONFIG_ROW(host, hostname, user, port, other_str))
+                
+                sys.stdout.write("\n".join(out) + "\n")
             
         except Exception as e:
             print(f"Error parsing SSH config: {e}")
     
     def print_known_hosts_details(self):
         """Print detailed known hosts table"""
-        known_hosts_path = os.path.expanduser("~/.ssh/known_hosts")
-        
-        if not os.path.exists(known_hosts_path):
+        try:
+            entries = self._parse_known_hosts()
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Error parsing known hosts: {e}")
             return
         
         try:
-            with open(known_hosts_path, 'r') as f:
-                lines = f.readlines()
-            
-            # Parse known hosts for detailed information
+            # (host, key type) tuples: cheaper to build than dicts, and
+            # they sort by host directly
             host_entries = []
-            
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
+            append = host_entries.append
+            for hosts, key_type in entries:
+                names = [host.decode(errors='replace') for host in hosts[:2]]  # Show max 2 hosts
+                display_host = ', '.join(names)
+                if len(hosts) > 2:
+                    display_host += f' (+{len(hosts)-2} more)'
                 
-                parts = line.split()
-                if len(parts) >= 3:
-                    host_part = parts[0]
-                    key_type = parts[1]
-                    # Extract hostname (handle hashed hosts)
-                    if host_part.startswith('|1|'):
-                        display_host = '[hashed]'
-                    else:
-                        # Handle comma-separated hosts and ports
-                        hosts = []
-                        for host in host_part.split(','):
-                            # Remove port numbers and brackets
-                            clean_host = host.split(':')[0].strip('[]')
-                            if clean_host:
-                                hosts.append(clean_host)
-                        display_host = ', '.join(hosts[:2])  # Show max 2 hosts
-                        if len(hosts) > 2:
-                            display_host += f' (+{len(hosts)-2} more)'
-                    
-                    host_entries.append({
-                        'host': display_host,
-                        'key_type': key_type
-                    })
+                append((display_host, key_type.decode(errors='replace')))
             
             if host_entries:
-                print(f"\n{Colors.BOLD}🔑 SSH Known Hosts Details{Colors.END}")
-                print("=" * 65)
-                print(f"{Colors.BOLD}{'Host/IP':<40} {'Key Type':<25}{Colors.END}")
-                print("-" * 65)
+                out = []
+                out.append(f"\n{Colors.BOLD}🔑 SSH Known Hosts Details{Colors.END}")
+                out.append("=" * 65)
+                out.append(f"{Colors.BOLD}{'Host/IP':<40} {'Key Type':<25}{Colors.END}")
+                out.append("-" * 65)
                 
                 # Sort by host for better readability
-                host_entries.sort(key=lambda x: x['host'])
+                host_entries.sort()
+                
+                for host, key_type in host_entries:
+                    out.append(_KNOWN_HOSTS_ROW(host, key_type))
                 
-                for entry in host_entries:
-                    print(f"{entry['host']:<40} {entry['key_type']:<25}")
+                sys.stdout.write("\n".join(out) + "\n")
             
         except Exception as e:
             print(f"Error parsing known hosts: {e}")
@@ -870,24 +1122,24 @@ class DevEnvChecker:
         if not hasattr(self, 'custom_hosts_entries') or not self.custom_hosts_entries:
             return
         
-        print(f"\n{Colors.BOLD}🏠 /etc/hosts Custom Entries{Colors.END}")
-        print("=" * 70)
-        print(f"{Colors.BOLD}{'IP Address':<20} {'Hostnames':<50}{Colors.END}")
-        print("-" * 70)
+        out = []
+        out.append(f"\n{Colors.BOLD}🏠 /etc/hosts Custom Entries{Colors.END}")
+        out.append("=" * 70)
+        out.append(f"{Colors.BOLD}{'IP Address':<20} {'Hostnames':<50}{Colors.END}")
+        out.append("-" * 70)
         
         for entry in self.custom_hosts_entries:
             hostnames_str = ', '.join(entry['hostnames'])
             # Truncate if too long
             if len(hostnames_str) > 48:
                 hostnames_str = hostnames_str[:45] + '...'
-            print(f"{entry['ip']:<20} {hostnames_str:<50}")
+            out.append(_HOSTS_ROW(entry['ip'], hostnames_str))
+        
+        sys.stdout.write("\n".join(out) + "\n")
     
     def print_ssh_keys_details(self):
         """Print detailed SSH keys table grouped by directory"""
-        ssh_dir = os.path.expanduser("~/.ssh")
-        
-        if not os.path.exists(ssh_dir) or not os.access(ssh_dir, os.R_OK):
-            return
+        ssh_dir = self.paths['ssh_dir']
         
         try:
             found_keys = []
@@ -897,57 +1149,38 @@ class DevEnvChecker:
                 if depth > max_depth:
                     return
                 
+                # Same single scandir pass as check_ssh_keys; the entries
+                # also carry the stat used for the creation date
                 try:
-                    items = os.listdir(directory)
-                except PermissionError:
+                    with os.scandir(directory) as it:
+                        entries = {e.name: e for e in it if not e.name.startswith('.')}
+                except OSError:
                     return
                 
-                for item in items:
-                    if item.startswith('.'):
-                        continue
-                        
-                    item_path = os.path.join(directory, item)
+                for item, entry in entries.items():
+                    item_path = entry.path
                     item_relative = os.path.join(relative_path, item) if relative_path else item
                     
-                    if os.path.isfile(item_path):
+                    if entry.is_file():
                         # Check if it's a potential private key (no .pub extension)
                         if not item.endswith('.pub'):
-                            pub_path = item_path + '.pub'
+                            pub_entry = entries.get(item + '.pub')
                             
                             # Only include keys that have corresponding .pub files
-                            if os.path.exists(pub_path):
+                            if pub_entry is not None:
                                 try:
-                                    # Try to determine key type by reading the public key
-                                    with open(pub_path, 'r') as f:
-                                        pub_content = f.read().strip()
-                                    
-                                    key_type = "Unknown"
-                                    key_details = ""
-                                    
-                                    if pub_content.startswith('ssh-rsa '):
-                                        key_type = "RSA"
-                                        key_details = "RSA key"
-                                    elif pub_content.startswith('ssh-dss '):
-                                        key_type = "DSA"
-                                        key_details = "DSA key"
-                                    elif pub_content.startswith('ecdsa-sha2-'):
-                                        key_type = "ECDSA"
-                                        if 'nistp256' in pub_content:
-                                            key_details = "ECDSA 256-bit"
-                                        elif 'nistp384' in pub_content:
-                                            key_details = "ECDSA 384-bit"
-                                        elif 'nistp521' in pub_content:
-                                            key_details = "ECDSA 521-bit"
-                                        else:
-                                            key_details = "ECDSA key"
-                                    elif pub_content.startswith('ssh-ed25519 '):
-                                        key_type = "ED25519"
-                                        key_details = "ED25519 256-bit"
+                                    # The algorithm name is the first field of the public
+                                    # key, so a 64-byte prefix is enough; other ECDSA
+                                    # curves still count as ECDSA
+                                    fields = self._read_head(pub_entry.path, 64).split(None, 1)
+                                    algorithm = fields[0].decode(errors='replace') if fields else ""
+                                    key_type, key_details = self._SSH_KEY_TYPES.get(
+                                        algorithm,
+                                        ("ECDSA", "ECDSA key") if algorithm.startswith('ecdsa-sha2-') else ("Unknown", ""))
                                     
                                     # Get file modification time for creation info
-                                    import time
-                                    mtime = os.path.getmtime(item_path)
-                                    created = time.strftime('%Y-%m-%d', time.localtime(mtime))
+                                    mtime = entry.stat().st_mtime
+                                    created = date.fromtimestamp(mtime).isoformat()  # Local YYYY-MM-DD
                                     
                                     found_keys.append({
                                         'name': item,
@@ -963,7 +1196,7 @@ class DevEnvChecker:
                                     # Skip problematic keys silently in details view
                                     continue
                     
-                    elif os.path.isdir(item_path) and depth < max_depth:
+                    elif entry.is_dir() and depth < max_depth:
                         # Recursively scan subdirectory
                         scan_directory(item_path, item_relative, depth + 1, max_depth)
             
@@ -971,13 +1204,13 @@ class DevEnvChecker:
             scan_directory(ssh_dir)
             
             if found_keys:
-                print(f"\n{Colors.BOLD}🔐 SSH Keys Details{Colors.END}")
-                print("=" * 110)
-                print(f"{Colors.BOLD}{'Directory':<20} {'Key Name':<25} {'Type':<15} {'Details':<20} {'Created':<15} {'Public':<10}{Colors.END}")
-                print("-" * 110)
+                out = []
+                out.append(f"\n{Colors.BOLD}🔐 SSH Keys Details{Colors.END}")
+                out.append("=" * 110)
+                out.append(f"{Colors.BOLD}{'Directory':<20} {'Key Name':<25} {'Type':<15} {'Details':<20} {'Created':<15} {'Public':<10}{Colors.END}")
+                out.append("-" * 110)
                 
                 # Group keys by directory and sort
-                from collections import defaultdict
                 keys_by_dir = defaultdict(list)
                 for key in found_keys:
                     keys_by_dir[key['directory']].append(key)
@@ -986,76 +1219,79 @@ class DevEnvChecker:
                 sorted_dirs = sorted(keys_by_dir.keys(), key=lambda x: (x != ".", x))
                 
                 for directory in sorted_dirs:
-                    dir_keys = sorted(keys_by_dir[directory], key=lambda x: x['name'])
+                    dir_keys = keys_by_dir[directory]
+                    if len(dir_keys) > 1:
+                        dir_keys.sort(key=itemgetter('name'))
                     
                     for i, key in enumerate(dir_keys):
                         dir_display = directory if i == 0 else ""
                         public_status = "✅ Yes" if key['has_public'] else "❌ No"
-                        print(f"{dir_display:<20} {key['name']:<25} {key['type']:<15} {key['details']:<20} {key['created']:<15} {public_status:<10}")
+                        out.append(_SSH_KEYS_ROW(dir_display, key['name'], key['type'], key['details'], key['created'], public_status))
+                
+                sys.stdout.write("\n".join(out) + "\n")
             
         except Exception as e:
             print(f"Error displaying SSH keys details: {e}")
     
-    def run_all_checks(self):
-        """Run all environment checks"""
+    def check_terraform_config(self):
+        """Check Terraform version details"""
+        # Reuse the version captured by check_command_version rather than
+        # spawning `terraform version` a second time
+        version_info = self._versions.get("terraform")
+        if version_info:
+            self.add_result("Terraform", "Version check", "OK", version_info)
+    
+    async def run_all_checks_async(self):
+        """Run all environment checks, overlapping file I/O and external command probes"""
         print(f"{Colors.BOLD}🔍 Local Development Environment Check{Colors.END}\n")
         
-        # File checks
+        # Everything below is independent: file checks run on worker threads
+        # and command probes as subprocesses, all at the same time
         print("Checking system files...")
-        self.check_hosts_file()
-        
-        # SSH configuration checks
         print("Checking SSH configuration...")
-        self.check_ssh_config()
-        self.check_ssh_known_hosts()
-        self.check_ssh_keys()
-        
-        # Command line tools
-        print("Checking command line tools...")
-        self.check_command_version("git", "Tools", "Git")
-        self.check_command_version("docker", "Tools", "Docker")
-        self.check_command_version("ansible", "Ansible", "Ansible")
-        self.check_command_version("terraform", "Terraform", "Terraform")
-        
-        # Cloud provider checks
-        print("Checking cloud providers...")
-        self.check_aws_credentials()
-        self.check_gcp_credentials()
-        self.check_digitalocean_credentials()
-        self.check_netlify_cli()
-        
-        # Ansible specific checks
+        print("Checking command line tools and cloud providers...")
         print("Checking Ansible configuration...")
-        self.check_ansible_config_smart()
+        await self.gather_checks(
+            asyncio.to_thread(self.check_hosts_file),
+            asyncio.to_thread(self.check_ssh_config),
+            asyncio.to_thread(self.check_ssh_known_hosts),
+            asyncio.to_thread(self.check_ssh_keys),
+            self.check_command_version("git", "Tools", "Git"),
+            self.check_command_version("docker", "Tools", "Docker"),
+            self.check_command_version("ansible", "Ansible", "Ansible"),
+            asyncio.to_thread(self.check_ansible_config_smart),
+            self.check_command_version("terraform", "Terraform", "Terraform"),
+            # The cloud checks report a missing CLI and skip their file
+            # checks too, as without the CLI there is nothing to probe
+            self.check_aws_credentials(),
+            self.check_gcp_credentials(),
+            self.check_digitalocean_credentials(),
+            self.check_netlify_cli(),
+            self.resolve_ssh_hosts(),
+        )
         
         # Terraform specific checks
         print("Checking Terraform configuration...")
-        if self.check_command_exists("terraform", "Terraform", "Terraform CLI"):
-            try:
-                result = subprocess.run(['terraform', 'version'], capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    # Take only the first line and clean it up
-                    version_info = result.stdout.strip().split('\n')[0]
-                    self.add_result("Terraform", "Version check", "OK", version_info)
-            except Exception as e:
-                self.add_result("Terraform", "Version check", "ERROR", str(e))
+        self.check_terraform_config()
+    
+    def run_all_checks(self):
+        """Run all environment checks"""
+        asyncio.run(self.run_all_checks_async())
     
     def print_results(self):
         """Print results in a tabular format"""
-        print(f"\n{Colors.BOLD}📊 Results Summary{Colors.END}")
-        print("=" * 120)
+        # Build the whole report and write it in one call
+        out = []
+        out.append(f"\n{Colors.BOLD}📊 Results Summary{Colors.END}")
+        out.append("=" * 120)
         
         # Table headers
-        print(f"{Colors.BOLD}{'Category':<15} {'Item':<35} {'Status':<12} {'Details':<50}{Colors.END}")
-        print("-" * 120)
+        out.append(f"{Colors.BOLD}{'Category':<15} {'Item':<35} {'Status':<12} {'Details':<50}{Colors.END}")
+        out.append("-" * 120)
         
-        # Group results by category
-        categories = {}
-        for result in self.results:
-            cat = result['category']
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(result)
+        # Results are grouped by category as they are recorded
+        categories = self._by_category
+        last_category = next(reversed(categories), None)
         
         # Print each category in table format
         for category, items in categories.items():
@@ -1063,30 +1299,35 @@ class DevEnvChecker:
                 # Show category name only for first item in each category
                 cat_display = category if i == 0 else ""
                 
-                status_str = self.print_status(item['status'])
-                details = item['details'] if item['details'] else ""
+                status_str = self.print_status(item.status)
+                details = item.details if item.details else ""
                 
-                # Truncate long details to fit in column
-                if len(details) > 47:
+                # Truncate long details to fit in column; piped output
+                # keeps them whole, flattened onto the row
+                if not _IS_TTY:
+                    details = ' '.join(details.split())
+                elif len(details) > 47:
                     details = details[:44] + "..."
                 
-                print(f"{cat_display:<15} {item['item']:<35} {status_str:<20} {details:<50}")
+                out.append(_RESULT_ROW(cat_display, item.item, status_str, details))
             
             # Add separator between categories
-            if category != list(categories.keys())[-1]:  # Not the last category
-                print("-" * 120)
+            if category != last_category:
+                out.append("-" * 120)
         
         # Summary statistics
         total = len(self.results)
-        ok_count = sum(1 for r in self.results if r['status'] == 'OK')
-        error_count = sum(1 for r in self.results if r['status'] in ['ERROR', 'MISSING'])
-        warning_count = sum(1 for r in self.results if r['status'] == 'WARNING')
+        ok_count = self._status_counts['OK']
+        error_count = self._status_counts['ERROR'] + self._status_counts['MISSING']
+        warning_count = self._status_counts['WARNING']
+        
+        out.append(f"\n{Colors.BOLD}Summary:{Colors.END}")
+        out.append(f"  Total checks: {total}")
+        out.append(f"  {Colors.GREEN}✅ Passed: {ok_count}{Colors.END}")
+        out.append(f"  {Colors.RED}❌ Failed: {error_count}{Colors.END}")
+        out.append(f"  {Colors.YELLOW}⚠️  Warnings: {warning_count}{Colors.END}")
         
-        print(f"\n{Colors.BOLD}Summary:{Colors.END}")
-        print(f"  Total checks: {total}")
-        print(f"  {Colors.GREEN}✅ Passed: {ok_count}{Colors.END}")
-        print(f"  {Colors.RED}❌ Failed: {error_count}{Colors.END}")
-        print(f"  {Colors.YELLOW}⚠️  Warnings: {warning_count}{Colors.END}")
+        sys.stdout.write("\n".join(out) + "\n")
 
 def main():
     """Main function"""
@@ -1097,7 +1338,7 @@ def main():
     checker = DevEnvChecker(project_path=args.project_path)
     
     try:
-        checker.run_all_checks()
+        asyncio.run(checker.run_all_checks_async())
         checker.print_results()
         
         # Print detailed tables
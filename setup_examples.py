@@ -6,8 +6,38 @@ Run this script to set up basic configurations for Ansible and DigitalOcean.
 
 import os
 import shutil
+import tempfile
 from pathlib import Path
 
+def install_file(src, dst, backup, description):
+    """Copy src to dst, first copying an existing dst to backup"""
+    # Write through a symlinked dst (e.g. into a dotfiles repo) rather
+    # than replacing the link itself
+    target = Path(os.path.realpath(dst))
+    
+    # Copy to a temporary file next to the target first and rename it
+    # over the target, so the existing config stays in place until the
+    # new one is complete
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    os.close(fd)
+    try:
+        shutil.copy2(src, tmp)
+        
+        # A missing dst is reported by the copy itself
+        try:
+            shutil.copy2(target, backup)
+        except FileNotFoundError:
+            pass
+        else:
+            print(f"  Backing up existing {description} to {backup}")
+        
+        os.replace(tmp, target)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    print(f"  ✅ Copied {src} -> {dst}")
+
 def setup_ansible_config():
     """Set up Ansible configuration files"""
     print("Setting up Ansible configuration...")
@@ -28,22 +58,10 @@ def setup_ansible_config():
     
     # Copy files
     if ansible_cfg_src.exists():
-        if ansible_cfg_dst.exists():
-            backup = ansible_cfg_dst.with_suffix('.cfg.backup')
-            print(f"  Backing up existing config to {backup}")
-            shutil.copy2(ansible_cfg_dst, backup)
-        
-        shutil.copy2(ansible_cfg_src, ansible_cfg_dst)
-        print(f"  ✅ Copied {ansible_cfg_src} -> {ansible_cfg_dst}")
+        install_file(ansible_cfg_src, ansible_cfg_dst, ansible_cfg_dst.with_suffix('.cfg.backup'), "config")
     
     if inventory_src.exists():
-        if inventory_dst.exists():
-            backup = inventory_dst.with_suffix('.backup')
-            print(f"  Backing up existing inventory to {backup}")
-            shutil.copy2(inventory_dst, backup)
-        
-        shutil.copy2(inventory_src, inventory_dst)
-        print(f"  ✅ Copied {inventory_src} -> {inventory_dst}")
+        install_file(inventory_src, inventory_dst, inventory_dst.with_suffix('.backup'), "inventory")
 
 def setup_doctl_config():
     """Set up DigitalOcean doctl configuration"""
@@ -61,13 +79,7 @@ def setup_doctl_config():
     
     # Copy file
     if doctl_cfg_src.exists():
-        if doctl_cfg_dst.exists():
-            backup = doctl_cfg_dst.with_suffix('.yaml.backup')
-            print(f"  Backing up existing config to {backup}")
-            shutil.copy2(doctl_cfg_dst, backup)
-        
-        shutil.copy2(doctl_cfg_src, doctl_cfg_dst)
-        print(f"  ✅ Copied {doctl_cfg_src} -> {doctl_cfg_dst}")
+        install_file(doctl_cfg_src, doctl_cfg_dst, doctl_cfg_dst.with_suffix('.yaml.backup'), "config")
         print(f"  ⚠️  Remember to replace YOUR_API_TOKEN with your actual DigitalOcean API token!")
 
 def main():